@@ -3,18 +3,24 @@ import unittest
 from graphql.language import parse, print_ast
 
 
+# Expected query files, cached by path so each fixture is read from disk once
+# per test run rather than once per test.
+_file_cache = {}
+
+
 class CeTestCase(unittest.TestCase):
 
-    @property
-    def test_directory(self):
-        return os.path.dirname(__file__)
+    test_directory = os.path.dirname(__file__)
 
     data_dir = ""
 
     def read_file(self, filename):
         if self.data_dir:
-            with open(os.path.join(self.data_dir, filename)) as fp:
-                return fp.read()
+            path = os.path.join(self.data_dir, filename)
+            if path not in _file_cache:
+                with open(path) as fp:
+                    _file_cache[path] = fp.read()
+            return _file_cache[path]
 
     @staticmethod
     def assert_queries_equal(q1, q2):
@@ -23,6 +23,28 @@ class TestMediaObject(CeTestCase):
         )
         self.assert_queries_equal(created_mediaobject, expected)
 
+    def test_sequence_create(self):
+        """A batch of media objects is created with a single aliased mutation"""
+        expected = self.read_file(os.path.join(self.data_dir, "create_mediaobject_sequence.txt"))
+
+        created_sequence = mediaobject.mutation_sequence_create_media_object([
+            dict(title="Rossinyol", description="Traditional choir piece", date="1972", creator="trompamusic.eu",
+                 contributor="www.upf.edu", format_="text/html", encodingformat="text/html",
+                 source="https://www.cpdl.org/wiki/index.php/Rossinyol",
+                 contenturl="https://www.cpdl.org/wiki/index.php/Rossinyol", language="en", inlanguage="ca"),
+            dict(title="El cant dels ocells", creator="trompamusic.eu", contributor="www.upf.edu",
+                 format_="text/html", source="https://www.cpdl.org/wiki/index.php/El_cant_dels_ocells"),
+        ])
+        self.assert_queries_equal(created_sequence, expected)
+
+    def test_sequence_create_invalid_values(self):
+        """Invalid values anywhere in the batch raise the same exceptions as the single create"""
+        with pytest.raises(NotAMimeTypeException):
+            mediaobject.mutation_sequence_create_media_object([
+                dict(title="Rossinyol", creator="trompamusic.eu", contributor="www.upf.edu",
+                     format_="html", source="https://www.cpdl.org/wiki/index.php/Rossinyol"),
+            ])
+
     def test_update_name(self):
         expected = self.read_file(os.path.join(self.data_dir, "update_mediaobject_name.txt"))
 
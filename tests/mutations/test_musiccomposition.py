@@ -44,6 +44,30 @@ class TestMusicComposition(CeTestCase):
         expected = self.read_file(os.path.join(self.data_dir, "create_musiccomposition_complete.txt"))
         self.assert_queries_equal(created_musiccomposition, expected)
 
+    def test_sequence_create(self):
+        """A batch of compositions is created with a single aliased mutation"""
+        expected = self.read_file(os.path.join(self.data_dir, "create_musiccomposition_sequence.txt"))
+
+        created_sequence = musiccomposition.mutation_sequence_create_music_composition([
+            dict(title="Das Lied von der Erde", contributor="https://www.cpdl.org", creator="https://www.upf.edu",
+                 source="https://www.cpdl.org/Das_Lied_von_der_Erde", format_="text/html",
+                 subject="Music Composition", language="en", inlanguage="de", name="The Song of the Earth"),
+            dict(title="Das Lied von der Erde: I. Das Trinklied vom Jammer der Erde",
+                 contributor="https://musicbrainz.org", creator="https://www.upf.edu",
+                 source="https://musicbrainz.org/work/ff15c2ab-0775-3757-975a-331357299635",
+                 format_="text/html", language="de", inlanguage="de", position=1),
+        ])
+        self.assert_queries_equal(created_sequence, expected)
+
+    def test_sequence_create_invalid_values(self):
+        """Invalid values anywhere in the batch raise the same exceptions as the single create"""
+        with pytest.raises(NotAMimeTypeException):
+            musiccomposition.mutation_sequence_create_music_composition([
+                dict(title="Das Lied von der Erde", contributor="https://www.cpdl.org",
+                     creator="https://www.upf.edu", source="https://www.cpdl.org/Das_Lied_von_der_Erde",
+                     format_="html"),
+            ])
+
     def test_update_name(self):
         expected = self.read_file(os.path.join(self.data_dir, "update_composition_name.txt"))
 
@@ -133,6 +157,21 @@ class TestMusicComposition(CeTestCase):
         )
         self.assert_queries_equal(created, expected)
 
+    def test_merge_music_composition_composer_parameterized(self):
+        """The parameterized variant returns one constant query plus a variables dict"""
+        expected = self.read_file(os.path.join(self.data_dir, "merge_music_composition_composer_parameterized.txt"))
+        query, variables = musiccomposition.mutation_merge_music_composition_composer_parameterized(
+            "ff562d2e-2265-4f61-b340-561c92e797e9",
+            "cd79f87e-39f3-44bc-ae2f-b9854ab6df3b"
+        )
+        self.assert_queries_equal(query, expected)
+        assert variables == {"fromIdentifier": "ff562d2e-2265-4f61-b340-561c92e797e9",
+                             "toIdentifier": "cd79f87e-39f3-44bc-ae2f-b9854ab6df3b"}
+
+        # The query string is identical (and cached) across identifier pairs
+        other_query, _ = musiccomposition.mutation_merge_music_composition_composer_parameterized("a", "b")
+        assert query is other_query
+
     def test_remove_music_composition_composer(self):
         expected = self.read_file(os.path.join(self.data_dir, "remove_music_composition_composer.txt"))
         created = musiccomposition.mutation_remove_music_composition_composer(
@@ -11,9 +11,9 @@ from tests import CeTestCase
 
 class TestPerson(CeTestCase):
 
-    def setUp(self) -> None:
-        super()
-        self.data_dir = os.path.join(self.test_directory, "data", "person")
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.data_dir = os.path.join(cls.test_directory, "data", "person")
 
     def test_create(self):
         expected = self.read_file(os.path.join(self.data_dir, "create_person.txt"))
@@ -8,9 +8,9 @@ from trompace.mutations.property import mutation_create_property, mutation_creat
 
 class TestProperty(CeTestCase):
 
-    def setUp(self) -> None:
-        super()
-        self.data_dir = os.path.join(self.test_directory, "data", "property")
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.data_dir = os.path.join(cls.test_directory, "data", "property")
 
     def test_create(self):
         expected = self.read_file(os.path.join(self.data_dir, "create_propery.txt"))
@@ -1,18 +1,32 @@
 import datetime
 import json
+import sys
 from datetime import date
 import logging
 
 logger = logging.getLogger(__file__)
 
 
+# A default JSONEncoder is stateless, so one shared instance serves every
+# make_filter/make_parameters call instead of allocating one per call.
+_ENCODER = json.JSONEncoder()
+
+
 def docstring_interpolate(name, values):
     """Interpolate a variable into a function's docstring.
     Use to prevent duplication of documentation in `create` and `update` methods."""
+    if sys.flags.optimize >= 2:
+        # -OO strips docstrings, so there is nothing to interpolate.
+        return lambda func: func
+
+    placeholder = "{" + name + "}"
+
     def _decorator(func):
-        args = {name: values}
+        # Each docstring contains a single placeholder, so a str.replace is
+        # enough and skips the format mini-language parse of the whole
+        # docstring at import time.
         if func.__doc__:
-            func.__doc__ = func.__doc__.format(**args)
+            func.__doc__ = func.__doc__.replace(placeholder, values)
         return func
 
     return _decorator
@@ -35,6 +49,8 @@ class StringConstant:
     be encoded or have quotes put around them. Use this to represent a constant
     and it won't be quoted in the query"""
 
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
@@ -53,7 +69,7 @@ def encode_list(thelist, encoder):
 
 
 def make_filter(args: dict):
-    encoder = json.JSONEncoder()
+    encoder = _ENCODER
     parts = ["{"]
     for k, v in args.items():
         parts.append(k + ":")
@@ -98,7 +114,7 @@ def make_parameters(**kwargs):
     Returns:
         A string representation of the graphql parameters
     """
-    encoder = json.JSONEncoder()
+    encoder = _ENCODER
     parts = []
     for k, v in kwargs.items():
         if isinstance(v, StringConstant):
@@ -124,6 +140,8 @@ class _Neo4jDate(StringConstant):
     day] or a year. The month and day in the list of dateparts are optional.
     All dateparts should be of type int."""
 
+    __slots__ = ()
+
     def __init__(self, value):
         if isinstance(value, str) and "-" in value:
             value = value.split("-")
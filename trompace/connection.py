@@ -5,14 +5,17 @@ from trompace.config import config
 from trompace.exceptions import QueryException
 
 
-async def submit_query_async(querystr: str, auth_required=False):
+async def submit_query_async(querystr: str, auth_required=False, variables=None):
     """Submit a query to the CE (async).
     Arguments:
         querystr: The query to be submitted
         auth_required: If true, send an authentication key with this request. Don't send a key
            if the global config.server_auth_required is false
+        variables: If set, a dict of GraphQL variables to send alongside the query
     """
     q = {"query": querystr}
+    if variables:
+        q["variables"] = variables
     headers = {}
     if auth_required and config.server_auth_required:
         token = config.jwt_token
@@ -32,7 +35,7 @@ async def submit_query_async(querystr: str, auth_required=False):
     return resp
 
 
-def submit_query(querystr: str, auth_required=False):
+def submit_query(querystr: str, auth_required=False, variables=None):
     """Submit a query to the CE.
 
     Args:
@@ -40,8 +43,11 @@ def submit_query(querystr: str, auth_required=False):
         auth_required: If ``True``, send an authentication key with this request. Required if the CE has authentication
           enabled and you are sending a mutation. Not required for queries. The request is not authenticated
           if the ``auth.required`` config item is ``False``
+        variables: If set, a dict of GraphQL variables to send alongside the query
     """
     q = {"query": querystr}
+    if variables:
+        q["variables"] = variables
     headers = {}
     if auth_required and config.server_auth_required:
         token = config.jwt_token
@@ -1,9 +1,25 @@
 import enum
 
-SUPPORTED_LANGUAGES = {"en", "es", "ca", "nl", "de", "fr"}
+from trompace import StringConstant
 
+SUPPORTED_LANGUAGES = frozenset({"en", "es", "ca", "nl", "de", "fr"})
 
-SUPPORTED_GENDER = {"male", "female", "other"}
+# Shared StringConstant wrappers for the supported languages, so that hot
+# mutation builders don't allocate a new wrapper for every call.
+LANGUAGE_CONSTANTS = {language: StringConstant(language) for language in SUPPORTED_LANGUAGES}
+
+
+def language_constant(language: str) -> StringConstant:
+    """Return the shared StringConstant for a supported language code.
+    Accepts mixed-case input but only lowercases when needed, so the common
+    already-lowercase case allocates nothing."""
+    constant = LANGUAGE_CONSTANTS.get(language)
+    if constant is None:
+        constant = LANGUAGE_CONSTANTS[language.lower()]
+    return constant
+
+
+SUPPORTED_GENDER = frozenset({"male", "female", "other"})
 
 
 class ActionStatusType(enum.Enum):
@@ -27,3 +43,8 @@ class ItemListOrderType(enum.Enum):
 
     def __str__(self):
         return self.name
+
+
+# Shared StringConstant wrappers for the ItemListOrderType values, like
+# LANGUAGE_CONSTANTS above.
+ITEMLISTORDER_CONSTANTS = {order: StringConstant(order) for order in ItemListOrderType}
@@ -1,6 +1,15 @@
 class UnsupportedLanguageException(Exception):
+    """Raised when a language is not in trompace.constants.SUPPORTED_LANGUAGES.
+
+    The message is built lazily in __str__ so that raising (the only cost paid
+    on a validation hot path) doesn't format a string that is often never
+    displayed.
+    """
     def __init__(self, language):
-        super().__init__("Language {} is not a supported language. See trompace.constants.SUPPORTED_LANGUAGES".format(language))
+        super().__init__(language)
+
+    def __str__(self):
+        return "Language {} is not a supported language. See trompace.constants.SUPPORTED_LANGUAGES".format(self.args[0])
 
 
 class InvalidActionStatusException(Exception):
@@ -14,8 +23,16 @@ class IDNotFoundException(Exception):
 
 
 class NotAMimeTypeException(ValueError):
+    """Raised when a value doesn't look like a MIME type.
+
+    Like UnsupportedLanguageException, the message is formatted on demand in
+    __str__ rather than at construction time.
+    """
     def __init__(self, object):
-        super().__init__("{} Not a valid mimetype".format(object))
+        super().__init__(object)
+
+    def __str__(self):
+        return "{} Not a valid mimetype".format(self.args[0])
 
 
 class ConfigRequirementException(Exception):
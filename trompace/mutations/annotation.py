@@ -2,7 +2,7 @@ import enum
 from typing import Union, List
 
 from trompace import filter_none_args, StringConstant, check_required_args
-from trompace.constants import SUPPORTED_LANGUAGES
+from trompace.constants import SUPPORTED_LANGUAGES, language_constant
 from trompace.exceptions import UnsupportedLanguageException
 from trompace.mutations.itemlist import mutation_create_itemlist, mutation_create_listitem
 from trompace.mutations.templates import format_mutation, format_link_mutation
@@ -93,8 +93,8 @@ def create_annotation_textual_body(creator: str, value: str, format_: str = None
               "value": value,
               "format": format_}
 
-    if language is not None:
-        params["language"] = StringConstant(language.lower())
+    if language:
+        params["language"] = language_constant(language)
 
     return format_mutation(mutationname="CreateAnnotationTextualBody", args=params)
 
@@ -244,8 +244,8 @@ def update_annotation_textual_body(identifier: str, value: str = None, format_:
               "format": format_}
     params = filter_none_args(params)
 
-    if language is not None:
-        params["language"] = StringConstant(language.lower())
+    if language:
+        params["language"] = language_constant(language)
 
     return format_mutation(mutationname="UpdateAnnotationTextualBody", args=params)
 
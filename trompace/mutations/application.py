@@ -1,8 +1,10 @@
 # Generate GraphQL queries for mutations pertaining to software applications.
+import re
+
 from trompace.exceptions import UnsupportedLanguageException, NotAMimeTypeException
-from trompace import StringConstant, filter_none_args
+from trompace import filter_none_args
 from .templates import mutation_create, mutation_link
-from ..constants import SUPPORTED_LANGUAGES
+from ..constants import SUPPORTED_LANGUAGES, LANGUAGE_CONSTANTS
 
 CREATE_APPLICATION = '''CreateSoftwareApplication(
         {parameters}
@@ -22,6 +24,15 @@ ADD_ENTRYPOINT_APPLICATION = '''AddEntryPointActionApplication(
         }}
     }}'''
 
+# Shared key layout for the CreateSoftwareApplication arguments. Copying a
+# template dict lets CPython reuse the hash table layout instead of growing a
+# fresh dict key by key on every call.
+_APP_ARGS_TEMPLATE = dict.fromkeys(("name", "contributor", "creator", "source", "title",
+                                    "subject", "description", "format", "softwareVersion"))
+
+# A mimetype is a type and a subtype separated by a slash (RFC 6838).
+_MIME_RE = re.compile(r"^[\w.+-]+/[\w.+-]+$")
+
 
 def mutation_create_application(*, name: str, contributor: str, creator: str, source: str, title: str = None,
                                 subject: str = None, language: str = None, description: str = None, format_: str = None,
@@ -46,22 +57,21 @@ def mutation_create_application(*, name: str, contributor: str, creator: str, so
 
     if language and language not in SUPPORTED_LANGUAGES:
         raise UnsupportedLanguageException(language)
-    if format_ and "/" not in format_:
+    if format_ and not _MIME_RE.match(format_):
         raise NotAMimeTypeException(format_)
 
-    args = {
-        "name": name,
-        "contributor": contributor,
-        "creator": creator,
-        "source": source,
-        "title": title,
-        "subject": subject,
-        "description": description,
-        "format": format_,
-        "softwareVersion": softwareversion
-    }
+    args = _APP_ARGS_TEMPLATE.copy()
+    args["name"] = name
+    args["contributor"] = contributor
+    args["creator"] = creator
+    args["source"] = source
+    args["title"] = title
+    args["subject"] = subject
+    args["description"] = description
+    args["format"] = format_
+    args["softwareVersion"] = softwareversion
     if language:
-        args["language"] = StringConstant(language.lower())
+        args["language"] = LANGUAGE_CONSTANTS[language]
 
     args = filter_none_args(args)
     return mutation_create(args, CREATE_APPLICATION)
@@ -1,5 +1,5 @@
-from trompace import StringConstant, _Neo4jDate, check_required_args, filter_none_args, docstring_interpolate
-from trompace.constants import SUPPORTED_LANGUAGES
+from trompace import _Neo4jDate, check_required_args, filter_none_args, docstring_interpolate
+from trompace.constants import SUPPORTED_LANGUAGES, LANGUAGE_CONSTANTS
 from trompace.exceptions import UnsupportedLanguageException, NotAMimeTypeException
 from trompace.mutations.templates import format_mutation, format_link_mutation
 
@@ -71,7 +71,7 @@ def mutation_create_audioobject(*, title: str, contributor: str, creator: str, s
     if date is not None:
         args["date"] = _Neo4jDate(date)
     if language is not None:
-        args["language"] = StringConstant(language.lower())
+        args["language"] = LANGUAGE_CONSTANTS[language]
 
     args = filter_none_args(args)
 
@@ -122,7 +122,7 @@ def mutation_update_audioobject(identifier: str, *, name: str = None, title: str
     if date:
         args["date"] = _Neo4jDate(date)
     if language:
-        args["language"] = StringConstant(language.lower())
+        args["language"] = LANGUAGE_CONSTANTS[language]
 
     args = filter_none_args(args)
 
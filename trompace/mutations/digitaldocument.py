@@ -1,8 +1,8 @@
 # Generate GraphQL queries for mutations pertaining to digital document objects.
-from trompace import StringConstant, check_required_args, docstring_interpolate, filter_none_args
+from trompace import check_required_args, docstring_interpolate, filter_none_args
 from trompace.exceptions import UnsupportedLanguageException, NotAMimeTypeException
 from .templates import format_mutation
-from ..constants import SUPPORTED_LANGUAGES
+from ..constants import SUPPORTED_LANGUAGES, LANGUAGE_CONSTANTS
 
 
 DIGITALDOCUMENT_ARGS_DOCS = """title: The title of the resource indicated by `source`
@@ -48,7 +48,7 @@ def mutation_create_digitaldocument(*, title: str, contributor: str, creator: st
         "description": description,
     }
     if language is not None:
-        args["language"] = StringConstant(language.lower())
+        args["language"] = LANGUAGE_CONSTANTS[language]
 
     args = filter_none_args(args)
 
@@ -72,6 +72,9 @@ def mutation_update_digitaldocument(identifier: str, *, title: str = None, contr
         Assertion error if the input language is not one of the supported languages.
     """
 
+    if language is not None and language not in SUPPORTED_LANGUAGES:
+        raise UnsupportedLanguageException(language)
+
     args = {
         "identifier": identifier,
         "title": title,
@@ -83,7 +86,7 @@ def mutation_update_digitaldocument(identifier: str, *, title: str = None, contr
         "description": description
     }
     if language is not None:
-        args["language"] = StringConstant(language.lower())
+        args["language"] = LANGUAGE_CONSTANTS[language]
 
     args = filter_none_args(args)
 
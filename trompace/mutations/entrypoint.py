@@ -2,9 +2,8 @@
 from typing import List
 
 from trompace.exceptions import UnsupportedLanguageException, NotAMimeTypeException
-from trompace import StringConstant
 from .templates import mutation_create
-from ..constants import SUPPORTED_LANGUAGES
+from ..constants import SUPPORTED_LANGUAGES, LANGUAGE_CONSTANTS
 
 CREATE_ENTRYPOINT = '''CreateEntryPoint(
         {parameters}
@@ -52,7 +51,7 @@ def mutation_create_entry_point(*, name: str, contributor: str, subject: str, cr
         "subject": subject,
         "description": description,
         "format": formatin,
-        "language": StringConstant(language.lower()),
+        "language": LANGUAGE_CONSTANTS[language],
         "actionPlatform": actionPlatform,
         "contentType": contentType,
         "encodingType": encodingType
@@ -1,11 +1,12 @@
-from graphql import validation
+from functools import lru_cache
+
 from typing import Optional, List
-from trompace import (docstring_interpolate, filter_none_args,
-                      StringConstant, check_required_args)
-from trompace.constants import ItemListOrderType
+from trompace import docstring_interpolate, check_required_args
+from trompace.constants import ItemListOrderType, ITEMLISTORDER_CONSTANTS
 from trompace.mutations import _verify_additional_type
-from trompace.mutations.templates import (format_mutation, format_link_mutation,
-                                          format_sequence_mutation, format_sequence_link_mutation)
+from trompace.mutations.templates import (format_mutation, format_link_mutation_cached,
+                                          format_sequence_link_mutation,
+                                          format_sequence_mutation_stream)
 import trompace.exceptions
 
 ITEMLIST_ARGS_DOCS = """name: The name of the ItemList object.
@@ -39,14 +40,15 @@ def mutation_create_itemlist(name: str, creator: str,
     args = {
         "creator": creator,
         "name": name,
-        "contributor": contributor,
-        "description": description,
-        "additionalType": additionaltype
     }
+    if contributor is not None:
+        args["contributor"] = contributor
+    if description is not None:
+        args["description"] = description
+    if additionaltype is not None:
+        args["additionalType"] = additionaltype
     if itemlistorder:
-        args["itemListOrder"] = StringConstant(itemlistorder)
-
-    args = filter_none_args(args)
+        args["itemListOrder"] = ITEMLISTORDER_CONSTANTS[itemlistorder]
 
     return format_mutation("CreateItemList", args)
 
@@ -71,22 +73,24 @@ def mutation_update_itemlist(identifier: str, name: str = None, creator: str = N
     check_required_args(identifier=identifier)
     additionaltype = _verify_additional_type(additionaltype)
 
-    args = {
-        "identifier": identifier,
-        "contributor": contributor,
-        "name": name,
-        "description": description,
-        "creator": creator,
-        "additionalType": additionaltype,
-    }
+    args = {"identifier": identifier}
+    if contributor is not None:
+        args["contributor"] = contributor
+    if name is not None:
+        args["name"] = name
+    if description is not None:
+        args["description"] = description
+    if creator is not None:
+        args["creator"] = creator
+    if additionaltype is not None:
+        args["additionalType"] = additionaltype
     if itemlistorder is not None:
-        args["itemListOrder"] = StringConstant(itemlistorder)
-
-    args = filter_none_args(args)
+        args["itemListOrder"] = ITEMLISTORDER_CONSTANTS[itemlistorder]
 
     return format_mutation("UpdateItemList", args)
 
 
+@lru_cache(maxsize=4096)
 def mutation_delete_itemlist(identifier: str):
     """Returns a mutation for deleting an ItemList object based
     on the identifier.
@@ -126,16 +130,18 @@ def mutation_create_listitem(creator: str, name: str = None, contributor: str =
         The string for the mutation for creating the ListItem.
     """
     check_required_args(creator=creator)
-    args = {
-        "contributor": contributor,
-        "name": name,
-        "creator": creator,
-        "description": description,
-        "itemUrl": itemurl,
-        "position": position,
-    }
-
-    args = filter_none_args(args)
+    args = {}
+    if contributor is not None:
+        args["contributor"] = contributor
+    if name is not None:
+        args["name"] = name
+    args["creator"] = creator
+    if description is not None:
+        args["description"] = description
+    if itemurl is not None:
+        args["itemUrl"] = itemurl
+    if position is not None:
+        args["position"] = position
 
     return format_mutation("CreateListItem", args)
 
@@ -153,21 +159,24 @@ def mutation_update_listitem(identifier: str, creator: str = None, name: str = N
     Returns:
         The string for the mutation for updating the ListItem.
     """
-    args = {
-        "identifier": identifier,
-        "creator": creator,
-        "name": name,
-        "contributor": contributor,
-        "description": description,
-        "itemUrl": itemurl,
-        "position": position,
-    }
-
-    args = filter_none_args(args)
+    args = {"identifier": identifier}
+    if creator is not None:
+        args["creator"] = creator
+    if name is not None:
+        args["name"] = name
+    if contributor is not None:
+        args["contributor"] = contributor
+    if description is not None:
+        args["description"] = description
+    if itemurl is not None:
+        args["itemUrl"] = itemurl
+    if position is not None:
+        args["position"] = position
 
     return format_mutation("UpdateListItem", args)
 
 
+@lru_cache(maxsize=4096)
 def mutation_delete_listitem(identifier: str):
     """Returns a mutation for deleting a ListItem object based on the
     identifier.
@@ -196,9 +205,11 @@ def mutation_add_listitem_nextitem(listitem_id: str, nextitem_id: str):
         The string for the mutation for adding a NextItem to a ListItem object
     based on the identifier.
     """
-    check_required_args(listitem_id=listitem_id, nextitem_id=nextitem_id)
-    return format_link_mutation("MergeListItemNextItem", listitem_id,
-                                nextitem_id)
+    if listitem_id is None:
+        raise ValueError("required argument 'listitem_id' must not be None")
+    if nextitem_id is None:
+        raise ValueError("required argument 'nextitem_id' must not be None")
+    return format_link_mutation_cached("MergeListItemNextItem", listitem_id, nextitem_id)
 
 
 def mutation_remove_listitem_nextitem(listitem_id: str, nextitem_id: str):
@@ -214,9 +225,11 @@ def mutation_remove_listitem_nextitem(listitem_id: str, nextitem_id: str):
         The string for the mutation for removing a NextItem from a ListItem
     object based on the identifier.
     """
-    check_required_args(listitem_id=listitem_id, nextitem_id=nextitem_id)
-    return format_link_mutation("RemoveListItemNextItem", listitem_id,
-                                nextitem_id)
+    if listitem_id is None:
+        raise ValueError("required argument 'listitem_id' must not be None")
+    if nextitem_id is None:
+        raise ValueError("required argument 'nextitem_id' must not be None")
+    return format_link_mutation_cached("RemoveListItemNextItem", listitem_id, nextitem_id)
 
 
 def mutation_add_listitem_item(listitem_id: str, item_id: str):
@@ -232,8 +245,11 @@ def mutation_add_listitem_item(listitem_id: str, item_id: str):
         The string for the mutation for adding a Item to a ListItem object
     based on the identifier.
     """
-    check_required_args(listitem_id=listitem_id, item_id=item_id)
-    return format_link_mutation("MergeListItemItem", listitem_id, item_id)
+    if listitem_id is None:
+        raise ValueError("required argument 'listitem_id' must not be None")
+    if item_id is None:
+        raise ValueError("required argument 'item_id' must not be None")
+    return format_link_mutation_cached("MergeListItemItem", listitem_id, item_id)
 
 
 def mutation_remove_listitem_item(listitem_id: str, item_id: str):
@@ -249,8 +265,11 @@ def mutation_remove_listitem_item(listitem_id: str, item_id: str):
         The string for the mutation for removing a Item from a ListItem
     object based on the identifier.
     """
-    check_required_args(listitem_id=listitem_id, item_id=item_id)
-    return format_link_mutation("RemoveListItemItem", listitem_id, item_id)
+    if listitem_id is None:
+        raise ValueError("required argument 'listitem_id' must not be None")
+    if item_id is None:
+        raise ValueError("required argument 'item_id' must not be None")
+    return format_link_mutation_cached("RemoveListItemItem", listitem_id, item_id)
 
 
 def mutation_add_itemlist_itemlist_element(itemlist_id: str, element_id: str):
@@ -266,9 +285,11 @@ def mutation_add_itemlist_itemlist_element(itemlist_id: str, element_id: str):
         The string for the mutation for adding an ThingInterface in an ItemList object
         based on the identifier,
     """
-    check_required_args(itemlist_id=itemlist_id, element_id=element_id)
-    return format_link_mutation("MergeItemListItemListElement", itemlist_id,
-                                element_id)
+    if itemlist_id is None:
+        raise ValueError("required argument 'itemlist_id' must not be None")
+    if element_id is None:
+        raise ValueError("required argument 'element_id' must not be None")
+    return format_link_mutation_cached("MergeItemListItemListElement", itemlist_id, element_id)
 
 
 def mutation_remove_itemlist_itemlist_element(itemlist_id: str,
@@ -285,9 +306,21 @@ def mutation_remove_itemlist_itemlist_element(itemlist_id: str,
         The string for the mutation for removing an ThingInterface from an ItemList
         object based on the identifier.
     """
-    check_required_args(itemlist_id=itemlist_id, element_id=element_id)
-    return format_link_mutation("RemoveItemListItemListElement", itemlist_id,
-                                element_id)
+    if itemlist_id is None:
+        raise ValueError("required argument 'itemlist_id' must not be None")
+    if element_id is None:
+        raise ValueError("required argument 'element_id' must not be None")
+    return format_link_mutation_cached("RemoveItemListItemListElement", itemlist_id, element_id)
+
+
+# Aliases for the common case of sequence mutations are precomputed so that
+# the hot loops below do an index lookup instead of formatting a new string
+# per element; longer sequences fall back to formatting.
+_SEQUENCE_ALIAS_TABLE_SIZE = 1024
+_LISTITEM_ALIASES = [f"ListItemAlias{i}" for i in range(_SEQUENCE_ALIAS_TABLE_SIZE)]
+_ITEMLIST_ELEMENT_ALIASES = [f"MergeItemListItemListElementAlias{i}" for i in range(_SEQUENCE_ALIAS_TABLE_SIZE)]
+_LISTITEM_ITEM_ALIASES = [f"MergeListItemItemAlias{i}" for i in range(_SEQUENCE_ALIAS_TABLE_SIZE)]
+_LISTITEM_NEXTITEM_ALIASES = [f"MergeListItemNextItemAlias{i}" for i in range(_SEQUENCE_ALIAS_TABLE_SIZE)]
 
 
 LISTITEM_SEQ_ARGS_DOCS = """listitems: the ListItems objects to create
@@ -310,21 +343,24 @@ def mutation_sequence_create_listitem(listitems: list, contributor: str, creator
     Returns:
         The string for the mutation for creating a sequence of ListItem objects
     """
-    mutation_list = []
-
     mutationname = "CreateListItem"
-    for pos, listitem in enumerate(listitems):
-        args = {
-            "contributor": contributor,
-            "name": name,
-            "creator": creator,
-            "description": description[pos],
-            "position": pos,
-        }
-        mutationalias = "ListItemAlias{}".format(pos)
-        mutation_list.append((mutationalias, mutationname, args))
 
-    return format_sequence_mutation(mutations=mutation_list)
+    def generate_mutations():
+        for pos, listitem in enumerate(listitems):
+            args = {
+                "contributor": contributor,
+                "name": name,
+                "creator": creator,
+                "description": description[pos],
+                "position": pos,
+            }
+            if pos < _SEQUENCE_ALIAS_TABLE_SIZE:
+                mutationalias = _LISTITEM_ALIASES[pos]
+            else:
+                mutationalias = f"ListItemAlias{pos}"
+            yield mutationalias, mutationname, args
+
+    return format_sequence_mutation_stream(generate_mutations())
 
 
 def mutation_sequence_add_itemlist_itemlist_element(itemlist_id: str,
@@ -348,7 +384,10 @@ def mutation_sequence_add_itemlist_itemlist_element(itemlist_id: str,
     mutationname = "MergeItemListItemListElement"
     for pos, element_id in enumerate(element_ids):
         args = [itemlist_id, element_id]
-        mutationalias = "MergeItemListItemListElementAlias{}".format(pos)
+        if pos < _SEQUENCE_ALIAS_TABLE_SIZE:
+            mutationalias = _ITEMLIST_ELEMENT_ALIASES[pos]
+        else:
+            mutationalias = f"MergeItemListItemListElementAlias{pos}"
         mutation_list.append((mutationalias, mutationname, args))
 
     return format_sequence_link_mutation(mutations=mutation_list)
@@ -373,10 +412,12 @@ def mutation_sequence_add_listitem_item(listitem_ids: list,
     mutation_list = []
 
     mutationname = "MergeListItemItem"
-    for pos, _ in enumerate(listitem_ids):
-        args = [listitem_ids[pos], item_ids[pos]]
-        mutationalias = "MergeListItemItemAlias{}".format(pos)
-        mutation_list.append((mutationalias, mutationname, args))
+    for pos, (listitem_id, item_id) in enumerate(zip(listitem_ids, item_ids)):
+        if pos < _SEQUENCE_ALIAS_TABLE_SIZE:
+            mutationalias = _LISTITEM_ITEM_ALIASES[pos]
+        else:
+            mutationalias = f"MergeListItemItemAlias{pos}"
+        mutation_list.append((mutationalias, mutationname, [listitem_id, item_id]))
 
     return format_sequence_link_mutation(mutations=mutation_list)
 
@@ -398,11 +439,11 @@ def mutation_sequence_add_listitem_nextitem(listitem_ids: list):
     mutation_list = []
 
     mutationname = "MergeListItemNextItem"
-    pos = 0
-    while pos+1 < len(listitem_ids):
-        args = [listitem_ids[pos], listitem_ids[pos+1]]
-        mutationalias = "MergeListItemNextItemAlias{}".format(pos)
-        mutation_list.append((mutationalias, mutationname, args))
-        pos += 1
+    for pos, (listitem_id, nextitem_id) in enumerate(zip(listitem_ids, listitem_ids[1:])):
+        if pos < _SEQUENCE_ALIAS_TABLE_SIZE:
+            mutationalias = _LISTITEM_NEXTITEM_ALIASES[pos]
+        else:
+            mutationalias = f"MergeListItemNextItemAlias{pos}"
+        mutation_list.append((mutationalias, mutationname, [listitem_id, nextitem_id]))
 
     return format_sequence_link_mutation(mutations=mutation_list)
@@ -1,8 +1,27 @@
 # Generate GraphQL queries for mutations pertaining to media object objects.
-from trompace import StringConstant, _Neo4jDate, check_required_args, filter_none_args, docstring_interpolate
-from trompace.constants import SUPPORTED_LANGUAGES
+import sys
+
+from trompace import _Neo4jDate, docstring_interpolate
+from trompace.constants import SUPPORTED_LANGUAGES, LANGUAGE_CONSTANTS
 from trompace.exceptions import UnsupportedLanguageException, NotAMimeTypeException
-from trompace.mutations.templates import format_mutation, format_link_mutation
+from trompace.mutations.templates import format_mutation, format_link_mutation_cached, format_sequence_mutation_stream
+
+# GraphQL field names for the create and update argument builds, hoisted so
+# each call only assembles a tuple of values to zip against them.
+_CREATE_FIELDS = ("title", "contributor", "creator", "source", "format", "name", "description",
+                  "encodingFormat", "embedUrl", "url", "license", "contentUrl", "inLanguage")
+_UPDATE_FIELDS = ("identifier", "name", "title", "description", "creator", "contributor", "format",
+                  "encodingFormat", "source", "subject", "url", "contentUrl", "license", "inLanguage")
+
+
+def _mime(val):
+    """Return val unchanged if it is None or looks like a MIME type, raising
+    NotAMimeTypeException otherwise. Returning the value lets callers validate
+    and bind in one expression."""
+    if val is None or "/" in val:
+        return val
+    raise NotAMimeTypeException(val)
+
 
 MEDIAOBJECT_ARGS_DOCS = """name: The name of the media object.
         description: An account of the media object.
@@ -39,40 +58,78 @@ def mutation_create_media_object(*, title: str, contributor: str, creator: str,
     Raises:
         UnsupportedLanguageException if the input language is not one of the supported languages.
     """
-    check_required_args(title=title, contributor=contributor, creator=creator, source=source, format_=format_)
+    args = _media_object_create_args(title=title, contributor=contributor, creator=creator, source=source,
+                                     format_=format_, name=name, description=description, date=date,
+                                     encodingformat=encodingformat, embedurl=embedurl, url=url,
+                                     contenturl=contenturl, language=language, inlanguage=inlanguage,
+                                     license=license)
+
+    return format_mutation("CreateMediaObject", args)
+
+
+def _media_object_create_args(*, title: str, contributor: str, creator: str, source: str, format_: str,
+                              name: str = None, description: str = None, date: str = None,
+                              encodingformat: str = None, embedurl: str = None, url: str = None,
+                              contenturl: str = None, language: str = None, inlanguage: str = None,
+                              license: str = None):
+    """Validate the arguments for creating a MediaObject and return them as a
+    dict suitable for make_parameters."""
+    # Validation is fused with value preparation: the required-argument sweep
+    # avoids packing a kwargs dict, and each optional value is checked,
+    # validated and interned in the same branch that prepares it.
+    for argname, value in (("title", title), ("contributor", contributor), ("creator", creator),
+                           ("source", source), ("format_", format_)):
+        if value is None:
+            raise ValueError(f"required argument '{argname}' must not be None")
     if language is not None and language not in SUPPORTED_LANGUAGES:
         raise UnsupportedLanguageException(language)
 
-    if "/" not in format_:
-        raise NotAMimeTypeException(format_)
-
-    if encodingformat is not None and "/" not in encodingformat:
-        raise NotAMimeTypeException(encodingformat)
-
-    args = {
-        "title": title,
-        "contributor": contributor,
-        "creator": creator,
-        "source": source,
-        "format": format_,
-        "name": name,
-        "description": description,
-        "encodingFormat": encodingformat,
-        "embedUrl": embedurl,
-        "url": url,
-        "license": license,
-        "contentUrl": contenturl,
-        "inLanguage": inlanguage,
-    }
+    # Bulk imports repeat the same MIME types and languages across thousands of
+    # records; interning collapses those values to one shared object each.
+    format_ = sys.intern(_mime(format_))
+    if encodingformat is not None:
+        encodingformat = sys.intern(_mime(encodingformat))
+    if inlanguage is not None:
+        inlanguage = sys.intern(inlanguage)
+
+    # Build the args in one pass, skipping unset values as we go instead of
+    # filtering a full dict afterwards.
+    args = {k: v for k, v in zip(_CREATE_FIELDS, (
+        title, contributor, creator, source, format_, name, description,
+        encodingformat, embedurl, url, license, contenturl, inlanguage,
+    )) if v is not None}
 
     if date is not None:
         args["date"] = _Neo4jDate(date)
     if language is not None:
-        args["language"] = StringConstant(language.lower())
+        args["language"] = LANGUAGE_CONSTANTS[language]
 
-    args = filter_none_args(args)
+    return args
 
-    return format_mutation("CreateMediaObject", args)
+
+@docstring_interpolate("mediaobject_args", MEDIAOBJECT_ARGS_DOCS)
+def mutation_sequence_create_media_object(mediaobjects: list):
+    """Returns a single mutation for creating many media object objects.
+
+    Intended for bulk ingests: one aliased document is built for the whole
+    batch instead of one mutation string per media object.
+
+    Arguments:
+        mediaobjects: a list of dicts, each holding the keyword arguments
+            accepted by ``mutation_create_media_object``:
+            {mediaobject_args}
+
+    Returns:
+        The string for a single mutation creating all of the media objects.
+
+    Raises:
+        UnsupportedLanguageException if a language is not one of the supported languages.
+    """
+    def generate_mutations():
+        for pos, mediaobject in enumerate(mediaobjects):
+            yield (f"CreateMediaObjectAlias{pos}", "CreateMediaObject", _media_object_create_args(**mediaobject))
+
+    return format_sequence_mutation_stream(generate_mutations())
 
 
 @docstring_interpolate("mediaobject_args", MEDIAOBJECT_ARGS_DOCS)
@@ -92,37 +149,25 @@ def mutation_update_media_object(identifier: str, *, name: str = None, title: st
     Raises:
         Assertion error if the input language or inLanguage is not one of the supported languages.
     """
-    if format_ is not None and "/" not in format_:
-        raise NotAMimeTypeException(format_)
-
-    if encodingformat is not None and "/" not in encodingformat:
-        raise NotAMimeTypeException(encodingformat)
+    if format_ is not None:
+        format_ = sys.intern(_mime(format_))
+    if encodingformat is not None:
+        encodingformat = sys.intern(_mime(encodingformat))
 
     if language is not None and language not in SUPPORTED_LANGUAGES:
         raise UnsupportedLanguageException(language)
 
-    args = {
-        "identifier": identifier,
-        "name": name,
-        "title": title,
-        "description": description,
-        "creator": creator,
-        "contributor": contributor,
-        "format": format_,
-        "encodingFormat": encodingformat,
-        "source": source,
-        "subject": subject,
-        "url": url,
-        "contentUrl": contenturl,
-        "license": license,
-        "inLanguage": inlanguage,
-    }
-    if date:
-        args["date"] = _Neo4jDate(date)
-    if language:
-        args["language"] = StringConstant(language.lower())
+    if inlanguage is not None:
+        inlanguage = sys.intern(inlanguage)
 
-    args = filter_none_args(args)
+    args = {k: v for k, v in zip(_UPDATE_FIELDS, (
+        identifier, name, title, description, creator, contributor, format_,
+        encodingformat, source, subject, url, contenturl, license, inlanguage,
+    )) if v is not None}
+    if date is not None:
+        args["date"] = _Neo4jDate(date)
+    if language is not None:
+        args["language"] = LANGUAGE_CONSTANTS[language]
 
     return format_mutation("UpdateMediaObject", args)
 
@@ -152,7 +197,7 @@ def mutation_merge_mediaobject_example_of_work(mediaobject_identifier: str, work
         A GraphQL mutation for MergeMediaObjectExampleOfWork.
     """
 
-    return format_link_mutation("MergeMediaObjectExampleOfWork", mediaobject_identifier, work_identifier)
+    return format_link_mutation_cached("MergeMediaObjectExampleOfWork", mediaobject_identifier, work_identifier)
 
 
 def mutation_remove_mediaobject_example_of_work(mediaobject_identifier: str, work_identifier: str):
@@ -167,7 +212,7 @@ def mutation_remove_mediaobject_example_of_work(mediaobject_identifier: str, wor
         A GraphQL mutation for RemoveMediaObjectExampleOfWork.
     """
 
-    return format_link_mutation("RemoveMediaObjectExampleOfWork", mediaobject_identifier, work_identifier)
+    return format_link_mutation_cached("RemoveMediaObjectExampleOfWork", mediaobject_identifier, work_identifier)
 
 
 def mutation_merge_media_object_encoding(mediaobject_identifier: str, mediaobject_derivative_identifier: str):
@@ -182,7 +227,7 @@ def mutation_merge_media_object_encoding(mediaobject_identifier: str, mediaobjec
         A GraphQL mutation for MergeMediaObjectEncoding.
     """
 
-    return format_link_mutation("MergeMediaObjectEncoding", mediaobject_identifier, mediaobject_derivative_identifier)
+    return format_link_mutation_cached("MergeMediaObjectEncoding", mediaobject_identifier, mediaobject_derivative_identifier)
 
 
 def mutation_remove_media_object_encoding(mediaobject_identifier: str, mediaobject_derivative_identifier: str):
@@ -197,7 +242,7 @@ def mutation_remove_media_object_encoding(mediaobject_identifier: str, mediaobje
         A GraphQL mutation for RemoveMediaObjectEncoding.
     """
 
-    return format_link_mutation("RemoveMediaObjectEncoding", mediaobject_identifier, mediaobject_derivative_identifier)
+    return format_link_mutation_cached("RemoveMediaObjectEncoding", mediaobject_identifier, mediaobject_derivative_identifier)
 
 
 def mutation_merge_media_object_wasderivedfrom(mediaobject_derivative_identifier: str,
@@ -214,7 +259,7 @@ def mutation_merge_media_object_wasderivedfrom(mediaobject_derivative_identifier
         A GraphQL mutation for MergeMediaObjectWasDerivedFrom.
     """
 
-    return format_link_mutation("MergeMediaObjectWasDerivedFrom",
+    return format_link_mutation_cached("MergeMediaObjectWasDerivedFrom",
                                 mediaobject_derivative_identifier,
                                 mediaobject_source_identifier)
 
@@ -231,7 +276,7 @@ def mutation_remove_media_object_wasderivedfrom(mediaobject_derivative_identifie
         A GraphQL mutation for RemoveMediaObjectWasDerivedFrom.
     """
 
-    return format_link_mutation("RemoveMediaObjectWasDerivedFrom",
+    return format_link_mutation_cached("RemoveMediaObjectWasDerivedFrom",
                                 mediaobject_derivative_identifier,
                                 mediaobject_source_identifier)
 
@@ -248,4 +293,4 @@ def mutation_add_media_object_used(mediaobject_identifier: str, thing_identifier
     Returns:
         A GraphQL mutation for MergeMediaObjectUsed.
     """
-    return format_link_mutation("MergeMediaObjectUsed", mediaobject_identifier, thing_identifier)
+    return format_link_mutation_cached("MergeMediaObjectUsed", mediaobject_identifier, thing_identifier)
@@ -1,8 +1,11 @@
 # Generate GraphQL queries for mutations pertaining to music composition objects.
-from trompace import StringConstant, check_required_args, filter_none_args, docstring_interpolate
-from trompace.constants import SUPPORTED_LANGUAGES
+from functools import lru_cache
+
+from trompace import check_required_args, docstring_interpolate
+from trompace.constants import SUPPORTED_LANGUAGES, LANGUAGE_CONSTANTS
 from trompace.exceptions import UnsupportedLanguageException, NotAMimeTypeException
-from trompace.mutations.templates import format_mutation, format_link_mutation
+from trompace.mutations.templates import (format_mutation, format_link_mutation, format_sequence_mutation,
+                                          format_parameterized_link_mutation, link_mutation_variables)
 
 
 MUSICCOMPOSITION_ARGS_DOCS = """title: The title of the resource indicated by `source`
@@ -36,6 +39,18 @@ def mutation_create_music_composition(*, title: str, contributor: str, creator:
         UnsupportedLanguageException: if ``language`` is not one of the supported languages.
         NotAMimeTypeException: if ``format_`` is not a valid mimetype
     """
+    args = _music_composition_create_args(title=title, contributor=contributor, creator=creator, source=source,
+                                          format_=format_, subject=subject, language=language, inlanguage=inlanguage,
+                                          name=name, description=description, position=position)
+
+    return format_mutation("CreateMusicComposition", args)
+
+
+def _music_composition_create_args(*, title: str, contributor: str, creator: str, source: str, format_: str,
+                                   subject: str = None, language: str = None, inlanguage: str = None,
+                                   name: str = None, description: str = None, position: int = None):
+    """Validate the arguments for creating a MusicComposition and return them
+    as a dict suitable for make_parameters."""
     check_required_args(title=title, contributor=contributor, creator=creator, source=source, format_=format_)
     if language and language not in SUPPORTED_LANGUAGES:
         raise UnsupportedLanguageException(language)
@@ -43,24 +58,56 @@ def mutation_create_music_composition(*, title: str, contributor: str, creator:
     if "/" not in format_:
         raise NotAMimeTypeException(format_)
 
+    # Only the required arguments are added up-front; optionals are set one by
+    # one so that no intermediate full dict is built and filtered afterwards.
     args = {
         "title": title,
         "contributor": contributor,
         "creator": creator,
         "format": format_,
-        "subject": subject,
-        "source": source,
-        "inLanguage": inlanguage,
-        "name": name,
-        "description": description,
-        "position": position
     }
-    if language is not None:
-        args["language"] = StringConstant(language.lower())
+    if subject is not None:
+        args["subject"] = subject
+    args["source"] = source
+    if inlanguage is not None:
+        args["inLanguage"] = inlanguage
+    if name is not None:
+        args["name"] = name
+    if description is not None:
+        args["description"] = description
+    if position is not None:
+        args["position"] = position
+    if language:
+        args["language"] = LANGUAGE_CONSTANTS[language]
+
+    return args
 
-    args = filter_none_args(args)
 
-    return format_mutation("CreateMusicComposition", args)
+@docstring_interpolate("musiccomposition_args", MUSICCOMPOSITION_ARGS_DOCS)
+def mutation_sequence_create_music_composition(compositions: list):
+    """Returns a single mutation for creating many music composition objects.
+
+    Intended for bulk ingests: one aliased document is built for the whole
+    batch instead of one mutation string per composition.
+
+    Args:
+        compositions: a list of dicts, each holding the keyword arguments
+            accepted by ``mutation_create_music_composition``:
+            {musiccomposition_args}
+
+    Returns:
+        The string for a single mutation creating all of the compositions.
+
+    Raises:
+        UnsupportedLanguageException: if a ``language`` is not one of the supported languages.
+        NotAMimeTypeException: if a ``format_`` is not a valid mimetype
+    """
+    mutation_list = []
+    for pos, composition in enumerate(compositions):
+        args = _music_composition_create_args(**composition)
+        mutation_list.append((f"CreateMusicCompositionAlias{pos}", "CreateMusicComposition", args))
+
+    return format_sequence_mutation(mutations=mutation_list)
 
 
 @docstring_interpolate("musiccomposition_args", MUSICCOMPOSITION_ARGS_DOCS)
@@ -87,22 +134,29 @@ def mutation_update_music_composition(identifier: str, *, title: str = None, con
     if format_ and "/" not in format_:
         raise NotAMimeTypeException(format_)
 
-    args = {"identifier": identifier,
-            "title": title,
-            "contributor": contributor,
-            "creator": creator,
-            "subject": subject,
-            "source": source,
-            "inLanguage": inlanguage,
-            "format": format_,
-            "name": name,
-            "description": description,
-            "position": position
-    }
-    if language is not None:
-        args["language"] = StringConstant(language.lower())
-
-    args = filter_none_args(args)
+    args = {"identifier": identifier}
+    if title is not None:
+        args["title"] = title
+    if contributor is not None:
+        args["contributor"] = contributor
+    if creator is not None:
+        args["creator"] = creator
+    if subject is not None:
+        args["subject"] = subject
+    if source is not None:
+        args["source"] = source
+    if inlanguage is not None:
+        args["inLanguage"] = inlanguage
+    if format_ is not None:
+        args["format"] = format_
+    if name is not None:
+        args["name"] = name
+    if description is not None:
+        args["description"] = description
+    if position is not None:
+        args["position"] = position
+    if language:
+        args["language"] = LANGUAGE_CONSTANTS[language]
 
     return format_mutation("UpdateMusicComposition", args)
 
@@ -165,6 +219,7 @@ def mutation_remove_music_composition_has_part(main_identifier, part_identifier)
     return format_link_mutation("RemoveMusicCompositionHasPart", main_identifier, part_identifier)
 
 
+@lru_cache(maxsize=4096)
 def mutation_merge_music_composition_composer(composition_identifier, person_identifier):
     """Returns a mutation for adding a Person as the composer of a MusicComposition
     (https://schema.org/composer).
@@ -176,6 +231,7 @@ def mutation_merge_music_composition_composer(composition_identifier, person_ide
     return format_link_mutation("MergeMusicCompositionComposer", composition_identifier, person_identifier)
 
 
+@lru_cache(maxsize=4096)
 def mutation_remove_music_composition_composer(composition_identifier, person_identifier):
     """Returns a mutation for removing a Person as the composer of a MusicComposition
     (https://schema.org/composer).
@@ -187,6 +243,37 @@ def mutation_remove_music_composition_composer(composition_identifier, person_id
     return format_link_mutation("RemoveMusicCompositionComposer", composition_identifier, person_identifier)
 
 
+def mutation_merge_music_composition_composer_parameterized(composition_identifier, person_identifier):
+    """Returns a mutation and variables for adding a Person as the composer of a MusicComposition
+    (https://schema.org/composer).
+    Unlike ``mutation_merge_music_composition_composer``, the identifiers are passed as
+    GraphQL variables, so the mutation string is the same for every pair of identifiers
+    and the server can reuse its parsed form of the document.
+
+    Args:
+        composition_identifier: The identifier of a MusicComposition.
+        person_identifier: The identifier of a Person who composed the MusicComposition.
+    Returns:
+        A (mutation, variables) tuple to pass to ``submit_query``.
+    """
+    return (format_parameterized_link_mutation("MergeMusicCompositionComposer"),
+            link_mutation_variables(composition_identifier, person_identifier))
+
+
+def mutation_remove_music_composition_composer_parameterized(composition_identifier, person_identifier):
+    """Returns a mutation and variables for removing a Person as the composer of a MusicComposition
+    (https://schema.org/composer).
+
+    Args:
+        composition_identifier: The identifier of a MusicComposition.
+        person_identifier: The identifier of a Person who composed the MusicComposition.
+    Returns:
+        A (mutation, variables) tuple to pass to ``submit_query``.
+    """
+    return (format_parameterized_link_mutation("RemoveMusicCompositionComposer"),
+            link_mutation_variables(composition_identifier, person_identifier))
+
+
 def mutation_merge_music_composition_exact_match(from_identifier, to_identifier):
     """Returns a mutation for indicating that two MusicComposition objects represent the same composition
     (http://www.w3.org/2004/02/skos/core#exactMatch).
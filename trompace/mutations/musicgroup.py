@@ -1,7 +1,7 @@
 from trompace.exceptions import UnsupportedLanguageException, NotAMimeTypeException
 from trompace.mutations.templates import format_mutation, format_link_mutation
-from trompace import StringConstant, _Neo4jDate, check_required_args, filter_none_args, docstring_interpolate
-from trompace.constants import SUPPORTED_LANGUAGES
+from trompace import _Neo4jDate, check_required_args, filter_none_args, docstring_interpolate
+from trompace.constants import SUPPORTED_LANGUAGES, language_constant
 
 
 MUSICGROUP_ARGS_DOCS = """title: The title of the resource indicated by `source`
@@ -52,8 +52,8 @@ def mutation_create_musicgroup(*, title: str, contributor: str, creator: str, so
         "image": image,
         "publisher": publisher,
     }
-    if language is not None:
-        args["language"] = StringConstant(language.lower())
+    if language:
+        args["language"] = language_constant(language)
     if founding_date is not None:
         args["foundingDate"] = _Neo4jDate(founding_date)
     if disolution_date is not None:
@@ -100,8 +100,8 @@ def mutation_update_musicgroup(identifier: str, *, title: str = None, contributo
         "image": image,
         "publisher": publisher,
     }
-    if language is not None:
-        args["language"] = StringConstant(language.lower())
+    if language:
+        args["language"] = language_constant(language)
     if founding_date is not None:
         args["foundingDate"] = _Neo4jDate(founding_date)
     if disolution_date is not None:
@@ -1,5 +1,5 @@
-from trompace import StringConstant, check_required_args, docstring_interpolate, filter_none_args
-from trompace.constants import SUPPORTED_LANGUAGES
+from trompace import check_required_args, docstring_interpolate, filter_none_args
+from trompace.constants import SUPPORTED_LANGUAGES, LANGUAGE_CONSTANTS
 from trompace.exceptions import NotAMimeTypeException, UnsupportedLanguageException
 from trompace.mutations.templates import format_link_mutation, format_mutation
 
@@ -42,7 +42,7 @@ def mutation_create_musicplaylist(*, title: str, contributor: str, creator: str,
         "numTracks": num_tracks
     }
     if language is not None:
-        args["language"] = StringConstant(language.lower())
+        args["language"] = LANGUAGE_CONSTANTS[language]
 
     args = filter_none_args(args)
 
@@ -78,7 +78,7 @@ def mutation_update_musicplaylist(identifier: str, *, title: str, contributor: s
         "numTracks": num_tracks
     }
     if language is not None:
-        args["language"] = StringConstant(language.lower())
+        args["language"] = LANGUAGE_CONSTANTS[language]
 
     args = filter_none_args(args)
 
@@ -1,7 +1,7 @@
 from trompace.exceptions import UnsupportedLanguageException, NotAMimeTypeException
 from trompace.mutations.templates import format_mutation, format_link_mutation
-from trompace import StringConstant, _Neo4jDate, check_required_args, filter_none_args, docstring_interpolate
-from trompace.constants import SUPPORTED_LANGUAGES
+from trompace import _Neo4jDate, check_required_args, filter_none_args, docstring_interpolate
+from trompace.constants import SUPPORTED_LANGUAGES, LANGUAGE_CONSTANTS
 
 
 MUSICRECORDING_ARGS_DOCS = """name: The name of the MusicRecording object.
@@ -46,7 +46,7 @@ def mutation_create_musicrecording(*, name: str = None, title: str,  description
     }
 
     if language is not None:
-        args["language"] = StringConstant(language.lower())
+        args["language"] = LANGUAGE_CONSTANTS[language]
     if date is not None:
         args["date"] = _Neo4jDate(date)
 
@@ -92,7 +92,7 @@ def mutation_update_musicrecording(identifier: str, *, title: str = None, contri
     if date is not None:
         args["date"] = _Neo4jDate(date)
     if language is not None:
-        args["language"] = StringConstant(language.lower())
+        args["language"] = LANGUAGE_CONSTANTS[language]
 
     args = filter_none_args(args)
 
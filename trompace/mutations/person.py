@@ -3,7 +3,7 @@
 from trompace.exceptions import UnsupportedLanguageException, NotAMimeTypeException
 from trompace.mutations.templates import format_mutation, format_link_mutation
 from trompace import StringConstant, _Neo4jDate, check_required_args, filter_none_args, docstring_interpolate
-from trompace.constants import SUPPORTED_LANGUAGES, SUPPORTED_GENDER
+from trompace.constants import SUPPORTED_LANGUAGES, SUPPORTED_GENDER, language_constant
 
 PERSON_ARGS_DOCS = """title: The title of the resource indicated by `source` (:dcterms:`title`)
         contributor: The main URL of the site where the information about this Person was taken from (:dcterms:`contributor`)
@@ -72,8 +72,8 @@ def mutation_create_person(*, title: str, contributor: str, creator: str, source
     }
     if gender is not None:
         args["gender"] = StringConstant(gender.lower())
-    if language is not None:
-        args["language"] = StringConstant(language.lower())
+    if language:
+        args["language"] = language_constant(language)
     if birth_date is not None:
         args["birthDate"] = _Neo4jDate(birth_date)
     if death_date is not None:
@@ -132,8 +132,8 @@ def mutation_update_person(identifier: str, *, title: str = None, contributor: s
     }
     if gender is not None:
         args["gender"] = StringConstant(gender.lower())
-    if language is not None:
-        args["language"] = StringConstant(language.lower())
+    if language:
+        args["language"] = language_constant(language)
     if birth_date is not None:
         args["birthDate"] = _Neo4jDate(birth_date)
     if death_date is not None:
@@ -1,5 +1,5 @@
-from trompace import StringConstant, check_required_args, filter_none_args, docstring_interpolate
-from trompace.constants import SUPPORTED_LANGUAGES
+from trompace import check_required_args, filter_none_args, docstring_interpolate
+from trompace.constants import SUPPORTED_LANGUAGES, LANGUAGE_CONSTANTS
 from trompace.exceptions import NotAMimeTypeException, UnsupportedLanguageException
 from trompace.mutations.templates import format_mutation, format_link_mutation
 
@@ -38,7 +38,7 @@ def mutation_create_place(*, title: str, contributor: str, creator: str, source:
         "name": name,
     }
     if language is not None:
-        args["language"] = StringConstant(language.lower())
+        args["language"] = LANGUAGE_CONSTANTS[language]
 
     args = filter_none_args(args)
 
@@ -75,7 +75,7 @@ def mutation_update_place(identifier: str, *, name: str = None, title: str = Non
         "source": source,
     }
     if language:
-        args["language"] = StringConstant(language.lower())
+        args["language"] = LANGUAGE_CONSTANTS[language]
 
     args = filter_none_args(args)
 
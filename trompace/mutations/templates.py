@@ -1,5 +1,7 @@
 # Templates for generating GraphQL queries for mutations.
 
+import string
+from functools import lru_cache
 from typing import Dict, Any
 
 from trompace import make_parameters
@@ -46,6 +48,70 @@ LINK_MUTATION_ALIAS_TEMPLATE = '''{mutationalias}: {mutationname}(
   }}'''
 
 
+PARAMETERIZED_LINK_MUTATION_TEMPLATE = '''mutation {mutationname}($fromIdentifier: ID!, $toIdentifier: ID!) {{
+  {mutationname}(
+    from: {{identifier: $fromIdentifier}}
+    to: {{identifier: $toIdentifier}}
+  ) {{
+    from {{
+      identifier
+    }}
+    to {{
+      identifier
+    }}
+  }}
+}}'''
+
+
+# The MUTATION wrapper has a single field, so it is pre-split once and applied
+# as a plain concatenation rather than a format call per mutation.
+_MUTATION_PREFIX, _MUTATION_SUFFIX = MUTATION.format(mutation="\x00").split("\x00")
+
+
+def _wrap_mutation(mutation: str):
+    return _MUTATION_PREFIX + mutation + _MUTATION_SUFFIX
+
+
+class QueryBuilder:
+    """Accumulate fragments of a GraphQL document in a single byte buffer.
+    Appending to a bytearray avoids the intermediate str objects created by
+    repeated concatenation; the document is decoded once when finished."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def emit(self, fragment: str):
+        self.buffer += fragment.encode()
+
+    def finish(self) -> str:
+        return self.buffer.decode()
+
+
+def _compile_template(template: str):
+    """Pre-split a str.format template into its literal and field segments and
+    return a renderer that joins them with keyword argument values.
+    This skips str.format's field parsing, which otherwise happens on every call."""
+    segments = []
+    for literal, field, _, _ in string.Formatter().parse(template):
+        segments.append((literal, field))
+
+    def render(**kwargs):
+        parts = []
+        for literal, field in segments:
+            parts.append(literal)
+            if field is not None:
+                parts.append(str(kwargs[field]))
+        return "".join(parts)
+
+    return render
+
+
+_render_mutation = _compile_template(MUTATION_TEMPLATE)
+_render_alias_mutation = _compile_template(MUTATION_ALIAS_TEMPLATE)
+_render_link_mutation = _compile_template(LINK_MUTATION_TEMPLATE)
+_render_alias_link_mutation = _compile_template(LINK_MUTATION_ALIAS_TEMPLATE)
+
+
 def format_sequence_link_mutation(mutations: list):
     """Create a mutation link sequence  to send to the Contributor Environment.
     Arguments:
@@ -53,14 +119,18 @@ def format_sequence_link_mutation(mutations: list):
     Returns:
         A formatted mutation sequence
     """
-    formatted_mutations = []
+    builder = QueryBuilder()
+    first = True
     for mutation in mutations:
         mutationalias, mutationname, args = mutation
         identifier_1, identifier_2 = args
-        formatted_mutation = create_alias_link_mutation(mutationalias=mutationalias, mutationname=mutationname, identifier_1=identifier_1, identifier_2=identifier_2)
-        formatted_mutations.append(formatted_mutation)
+        if first:
+            first = False
+        else:
+            builder.emit("\n")
+        builder.emit(create_alias_link_mutation(mutationalias=mutationalias, mutationname=mutationname, identifier_1=identifier_1, identifier_2=identifier_2))
 
-    return MUTATION.format(mutation="\n".join(formatted_mutations))
+    return _wrap_mutation(builder.finish())
 
 
 def create_alias_link_mutation(mutationalias: str, mutationname: str, identifier_1: str, identifier_2: str):
@@ -73,7 +143,7 @@ def create_alias_link_mutation(mutationalias: str, mutationname: str, identifier
     Returns:
         A mutation string
     """
-    return LINK_MUTATION_ALIAS_TEMPLATE.format(mutationalias=mutationalias, mutationname=mutationname, identifier_1=identifier_1, identifier_2=identifier_2)
+    return _render_alias_link_mutation(mutationalias=mutationalias, mutationname=mutationname, identifier_1=identifier_1, identifier_2=identifier_2)
 
 
 def format_sequence_mutation(mutations: list):
@@ -83,13 +153,30 @@ def format_sequence_mutation(mutations: list):
     Returns:
         A formatted mutation sequence
     """
-    formatted_mutations = []
-    for mutation in mutations:
-        mutationalias, mutationname, args = mutation
-        formatted_mutation = create_alias_mutation(mutationalias=mutationalias, mutationname=mutationname, args=args)
-        formatted_mutations.append(formatted_mutation)
+    return format_sequence_mutation_stream(mutations)
 
-    return MUTATION.format(mutation="\n".join(formatted_mutations))
+
+def format_sequence_mutation_stream(mutations):
+    """Create a mutation sequence to send to the Contributor Environment,
+    consuming the input in a single pass.
+    Unlike ``format_sequence_mutation`` this accepts any iterable (including
+    a generator), so callers producing large sequences don't need to build an
+    intermediate list of mutations first.
+    Arguments:
+        mutations: an iterable of mutations [(mutationalias, mutationname, args),...]
+    Returns:
+        A formatted mutation sequence
+    """
+    builder = QueryBuilder()
+    first = True
+    for mutationalias, mutationname, args in mutations:
+        if first:
+            first = False
+        else:
+            builder.emit("\n")
+        builder.emit(create_alias_mutation(mutationalias=mutationalias, mutationname=mutationname, args=args))
+
+    return _wrap_mutation(builder.finish())
 
 
 def create_alias_mutation(mutationalias: str, mutationname: str, args: Dict[str, Any]):
@@ -101,7 +188,7 @@ def create_alias_mutation(mutationalias: str, mutationname: str, args: Dict[str,
     Returns:
         A mutation string
     """
-    return MUTATION_ALIAS_TEMPLATE.format(mutationalias=mutationalias, mutationname=mutationname, parameters=make_parameters(**args))
+    return _render_alias_mutation(mutationalias=mutationalias, mutationname=mutationname, parameters=make_parameters(**args))
 
 
 def format_alias_mutation(mutationalias: str, mutationname: str, args: Dict[str, Any]):
@@ -113,8 +200,8 @@ def format_alias_mutation(mutationalias: str, mutationname: str, args: Dict[str,
     Returns:
         A formatted mutation
     """
-    formatted_mutation = MUTATION_ALIAS_TEMPLATE.format(mutationalias=mutationalias, mutationname=mutationname, parameters=make_parameters(**args))
-    return MUTATION.format(mutation=formatted_mutation)
+    formatted_mutation = _render_alias_mutation(mutationalias=mutationalias, mutationname=mutationname, parameters=make_parameters(**args))
+    return _wrap_mutation(formatted_mutation)
 
 
 def format_mutation(mutationname: str, args: Dict[str, Any]):
@@ -126,8 +213,8 @@ def format_mutation(mutationname: str, args: Dict[str, Any]):
         A formatted mutation
     """
 
-    formatted_mutation = MUTATION_TEMPLATE.format(mutationname=mutationname, parameters=make_parameters(**args))
-    return MUTATION.format(mutation=formatted_mutation)
+    formatted_mutation = _render_mutation(mutationname=mutationname, parameters=make_parameters(**args))
+    return _wrap_mutation(formatted_mutation)
 
 
 def format_link_mutation(mutationname: str, identifier_1: str, identifier_2: str):
@@ -139,8 +226,49 @@ def format_link_mutation(mutationname: str, identifier_1: str, identifier_2: str
     Returns:
         A formatted mutation
     """
-    return MUTATION.format(mutation=LINK_MUTATION_TEMPLATE.format(mutationname=mutationname, identifier_1=identifier_1,
-                                                                  identifier_2=identifier_2))
+    return _wrap_mutation(_render_link_mutation(mutationname=mutationname, identifier_1=identifier_1,
+                                                identifier_2=identifier_2))
+
+
+@lru_cache(maxsize=4096)
+def format_link_mutation_cached(mutationname: str, identifier_1: str, identifier_2: str):
+    """Render a link mutation through a shared cache.
+    Modules whose link wrappers differ only in the mutation name funnel
+    through this memoized path so repeated links render their document once.
+    Arguments:
+        mutationname: the name of the mutation to generate
+        identifier_1: The unique identifier of the first object.
+        identifier_2: The unique identifier of the second object.
+    Returns:
+        A formatted mutation
+    """
+    return format_link_mutation(mutationname, identifier_1, identifier_2)
+
+
+@lru_cache()
+def format_parameterized_link_mutation(mutationname: str):
+    """Create a link mutation that takes its identifiers as GraphQL variables.
+    The returned document only depends on the mutation name, so repeated calls
+    with different identifiers submit an identical query string and the server
+    can reuse its parsed and validated form.
+    Arguments:
+        mutationname: the name of the mutation to generate
+    Returns:
+        A mutation string with $fromIdentifier and $toIdentifier variables
+    """
+    return PARAMETERIZED_LINK_MUTATION_TEMPLATE.format(mutationname=mutationname)
+
+
+def link_mutation_variables(identifier_1: str, identifier_2: str):
+    """Build the variables dict for a mutation made with
+    ``format_parameterized_link_mutation``.
+    Arguments:
+        identifier_1: The unique identifier of the first object.
+        identifier_2: The unique identifier of the second object.
+    Returns:
+        A dict to pass as the ``variables`` argument of ``submit_query``
+    """
+    return {"fromIdentifier": identifier_1, "toIdentifier": identifier_2}
 
 
 def mutation_create(args, mutation_string: str):
@@ -154,7 +282,7 @@ def mutation_create(args, mutation_string: str):
     """
 
     create_mutation = mutation_string.format(parameters=make_parameters(**args))
-    return MUTATION.format(mutation=create_mutation)
+    return _wrap_mutation(create_mutation)
 
 
 def mutation_update(args, mutation_string: str):
@@ -168,7 +296,7 @@ def mutation_update(args, mutation_string: str):
     """
 
     create_mutation = mutation_string.format(parameters=make_parameters(**args))
-    return MUTATION.format(mutation=create_mutation)
+    return _wrap_mutation(create_mutation)
 
 
 def mutation_delete(identifier: str, mutation_string: str):
@@ -184,7 +312,7 @@ def mutation_delete(identifier: str, mutation_string: str):
     args = {"identifier": identifier}
 
     delete_mutation = mutation_string.format(parameters=make_parameters(**args))
-    return MUTATION.format(mutation=delete_mutation)
+    return _wrap_mutation(delete_mutation)
 
 
 def mutation_link(identifier_1: str, identifier_2: str, mutation_string: str):
@@ -197,4 +325,4 @@ def mutation_link(identifier_1: str, identifier_2: str, mutation_string: str):
     """
 
     broad_match_mutation = mutation_string.format(identifier_1=identifier_1, identifier_2=identifier_2)
-    return MUTATION.format(mutation=broad_match_mutation)
+    return _wrap_mutation(broad_match_mutation)
@@ -24,7 +24,7 @@ def query_softwareapplication(identifier: str = None, title: str = None, contrib
     """
 
     if return_items is None:
-        return_items = ["identifier", "creator", "title", "source"]
+        return_items = ("identifier", "creator", "title", "source")
 
     args = {
         "identifier": identifier,
@@ -33,7 +33,7 @@ def query_audioobject(identifier: str = None, title: str = None, contributor: st
     """
 
     if return_items is None:
-        return_items = ["identifier", "creator", "title", "source"]
+        return_items = ("identifier", "creator", "title", "source")
 
     args = {
         "identifier": identifier,
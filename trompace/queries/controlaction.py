@@ -46,6 +46,12 @@ QUERY_CONTROLACTION_ID = """
     }}
 """
 
+# The template has a single field, so it is split once at import time and the
+# identifier spliced in with concatenation, skipping str.format's parse of the
+# whole (heavily brace-escaped) document on every call.
+_CONTROLACTION_ID_PREFIX, _CONTROLACTION_ID_SUFFIX = \
+    QUERY_CONTROLACTION_ID.format(identifier="\x00").split("\x00")
+
 
 def query_controlaction(identifier: str):
 
@@ -55,10 +61,9 @@ def query_controlaction(identifier: str):
     Returns:
         The string for the quereing the control action.
     """
-    query_ca = QUERY_CONTROLACTION_ID.format(identifier=identifier)
-    return query_ca
+    return _CONTROLACTION_ID_PREFIX + identifier + _CONTROLACTION_ID_SUFFIX
 
-def query_controlaction_filter(filter: str, return_items_list: list = ["identifier", "name"]):
+def query_controlaction_filter(filter: str, return_items_list: tuple = ("identifier", "name")):
 
     """Returns a query for querying the database for a controlaction object given a specific filter.
     Arguments:
@@ -3,7 +3,7 @@ from trompace.queries.templates import format_filter_query, format_itemlist_quer
 from trompace import StringConstant, _Neo4jDate, filter_none_args, docstring_interpolate
 
 
-def query_listitems(identifiers: list = None, return_items_list: list = ["identifier"]):
+def query_listitems(identifiers: list = None, return_items_list: tuple = ("identifier",)):
 
     """Returns a query for querying the database for a ThingInterface object.
     Arguments:
@@ -3,10 +3,13 @@ from typing import Union
 
 from trompace.exceptions import UnsupportedLanguageException, NotAMimeTypeException
 from trompace.queries.templates import format_query
-from trompace import StringConstant, _Neo4jDate, filter_none_args, docstring_interpolate, make_filter
+from trompace import StringConstant, _Neo4jDate, docstring_interpolate, make_filter
 from trompace.constants import SUPPORTED_LANGUAGES
 
 
+_QUERY_FIELDS = ("identifier", "creator", "contributor", "encodingFormat", "source", "contentUrl", "inLanguage")
+
+
 def query_mediaobject(identifier: str = None, creator: str = None, contributor: str = None,
                       encodingformat: str = None, source: str = None, contenturl: str = None, inlanguage: str = None,
                       filter_: dict = None, return_items: Union[list, str] = None):
@@ -30,20 +33,12 @@ def query_mediaobject(identifier: str = None, creator: str = None, contributor:
     """
 
     if return_items is None:
-        return_items = ["identifier", "name"]
-
-    args = {
-        "identifier": identifier,
-        "creator": creator,
-        "contributor": contributor,
-        "encodingFormat": encodingformat,
-        "source": source,
-        "contentUrl": contenturl,
-        "inLanguage": inlanguage
-    }
+        return_items = ("identifier", "name")
+
+    args = {k: v for k, v in zip(_QUERY_FIELDS, (
+        identifier, creator, contributor, encodingformat, source, contenturl, inlanguage,
+    )) if v is not None}
     if filter_:
         args["filter"] = StringConstant(make_filter(filter_))
 
-    args = filter_none_args(args)
-
     return format_query("MediaObject", args, return_items)
@@ -31,7 +31,7 @@ def query_musiccomposition(identifier: str = None, title: str = None, contributo
     """
 
     if return_items is None:
-        return_items = ["identifier", "title", "source"]
+        return_items = ("identifier", "title", "source")
 
     if inlanguage and inlanguage not in SUPPORTED_LANGUAGES:
         raise UnsupportedLanguageException(inlanguage)
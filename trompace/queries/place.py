@@ -4,7 +4,7 @@ from trompace import filter_none_args
 
 def query_place(identifier: str = None, title: str = None, contributor: str = None, creator: str = None,
                 source: str = None, format_: str = None, name: str = None,
-                return_items_list: list = ["identifier", "name"]):
+                return_items_list: tuple = ("identifier", "name")):
 
     """Returns a query for retrieving a place or places.
 
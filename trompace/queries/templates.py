@@ -1,6 +1,7 @@
 # Templates for generating GraphQL queries.
 
 # To be added EntryPoint, ControlAction, PropertyValueSpecification and Property
+from functools import lru_cache
 from typing import Dict, Any, Union
 
 from trompace.queries import QUERY
@@ -37,7 +38,15 @@ itemListElement{{
 }}'''
 
 
-def format_query(queryname: str, args: Dict[str, Any], return_items: Union[list, str]):
+@lru_cache(maxsize=64)
+def _return_block(items: tuple) -> str:
+    """Render a tuple of plain field names once and reuse it.
+    Bulk callers query thousands of objects with the same field set, so the
+    joined return block is worth caching."""
+    return make_select_query(items)
+
+
+def format_query(queryname: str, args: Dict[str, Any], return_items: Union[list, tuple, str]):
     """Create a query to send to the Contributor Environment.
     Arguments:
         queryname: the name of the query to generate
@@ -50,8 +59,11 @@ def format_query(queryname: str, args: Dict[str, Any], return_items: Union[list,
     parameters = ""
     if args:
         parameters = "({})".format(make_parameters(**args))
-    if isinstance(return_items, list):
-        return_items = make_select_query(return_items)
+    if isinstance(return_items, (list, tuple)):
+        if all(isinstance(item, str) for item in return_items):
+            return_items = _return_block(tuple(return_items))
+        else:
+            return_items = make_select_query(return_items)
     formatted_query = QUERY_TEMPLATE.format(queryname=queryname, parameters=parameters,
                                             return_items=return_items)
     return QUERY.format(query=formatted_query)